@@ -0,0 +1,1093 @@
+const { runId, baseFileName } = window.__CHECKLIST_CONFIG;
+const storageKey = 'customChecklist:' + document.title + ':' + runId;
+const state = JSON.parse(localStorage.getItem(storageKey) || '{}');
+let saveTimer = null;
+// Every change to the checklist goes through saveState/scheduleSave, so they
+// also drop the cached report; see cachedBuildReport().
+let reportCache = null;
+const saveState = () => {
+  reportCache = null;
+  clearTimeout(saveTimer);
+  saveTimer = null;
+  localStorage.setItem(storageKey, JSON.stringify(state));
+};
+const scheduleSave = () => {
+  reportCache = null;
+  clearTimeout(saveTimer);
+  saveTimer = setTimeout(saveState, 400);
+};
+const flushSave = () => {
+  if (saveTimer) saveState();
+};
+window.addEventListener('beforeunload', flushSave);
+document.addEventListener('visibilitychange', () => {
+  if (document.visibilityState === 'hidden') flushSave();
+});
+const slugify = (text) => text.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/(^-|-$)/g, '') || 'checklist';
+let titleSlug = null;
+const reportSlug = () => {
+  if (titleSlug === null) titleSlug = slugify(document.title);
+  return titleSlug;
+};
+state.meta = state.meta || {};
+state.meta.environment = state.meta.environment || {};
+state.logs = state.logs || [];
+const activityList = document.getElementById('activity-list');
+const renderLogs = () => {
+  activityList.innerHTML = '';
+  state.logs.forEach((entry) => {
+    const li = document.createElement('li');
+    li.textContent = `[${entry.at}] ${entry.action}`;
+    activityList.appendChild(li);
+  });
+};
+let logRenderScheduled = false;
+const scheduleLogRender = () => {
+  if (logRenderScheduled) return;
+  logRenderScheduled = true;
+  const render = () => {
+    logRenderScheduled = false;
+    renderLogs();
+  };
+  if (window.requestIdleCallback) {
+    window.requestIdleCallback(render, { timeout: 250 });
+  } else {
+    window.requestAnimationFrame(render);
+  }
+};
+const copyText = (text, button, statusEl) => {
+  if (!text) return;
+  const showCopied = () => {
+    const status = statusEl || (button ? button.closest('.block-head')?.querySelector('.copy-status') : null);
+    if (!status) return;
+    status.textContent = 'Copied';
+    status.classList.add('show');
+    setTimeout(() => {
+      status.textContent = '';
+      status.classList.remove('show');
+    }, 1500);
+  };
+  if (button) {
+    button.classList.add('copied');
+    setTimeout(() => button.classList.remove('copied'), 1500);
+  }
+  if (navigator.clipboard && navigator.clipboard.writeText) {
+    navigator.clipboard.writeText(text).then(showCopied).catch(showCopied);
+    return;
+  }
+  const area = document.createElement('textarea');
+  area.value = text;
+  document.body.appendChild(area);
+  area.select();
+  document.execCommand('copy');
+  area.remove();
+  showCopied();
+};
+const statusBars = document.getElementById('status-bars');
+const statusSummary = { pass: 0, fail: 0, blocked: 0, skipped: 0, not_set: 0 };
+const statusTotal = () => Object.values(statusSummary).reduce((a, b) => a + b, 0) || 1;
+const statusRows = {};
+const renderStatusChart = () => {
+  const total = statusTotal();
+  const order = [
+    ['pass', 'Pass'],
+    ['fail', 'Fail'],
+    ['blocked', 'Blocked'],
+    ['skipped', 'Skipped'],
+    ['not_set', 'Not set'],
+  ];
+  const fragment = document.createDocumentFragment();
+  for (const [key, label] of order) {
+    const count = statusSummary[key] || 0;
+    const row = document.createElement('div');
+    row.className = 'status-row';
+    const labelCell = document.createElement('div');
+    labelCell.className = 'status-label';
+    labelCell.textContent = label;
+    const bar = document.createElement('div');
+    bar.className = 'status-bar';
+    const fill = document.createElement('span');
+    fill.className = key;
+    fill.style.width = `${(count / total) * 100}%`;
+    bar.appendChild(fill);
+    const countCell = document.createElement('div');
+    countCell.className = 'status-label';
+    countCell.textContent = count;
+    row.appendChild(labelCell);
+    row.appendChild(bar);
+    row.appendChild(countCell);
+    fragment.appendChild(row);
+    statusRows[key] = { fill, countCell };
+  }
+  statusBars.replaceChildren(fragment);
+};
+const updateStatusRow = (value) => {
+  const row = statusRows[value];
+  if (!row) return;
+  const count = statusSummary[value] || 0;
+  row.fill.style.width = `${(count / statusTotal()) * 100}%`;
+  row.countCell.textContent = count;
+};
+const pendingStatusRows = new Set();
+let chartPending = false;
+const flushChart = () => {
+  chartPending = false;
+  pendingStatusRows.forEach(updateStatusRow);
+  pendingStatusRows.clear();
+};
+const scheduleChart = (...values) => {
+  values.forEach((value) => pendingStatusRows.add(value));
+  if (chartPending) return;
+  chartPending = true;
+  requestAnimationFrame(() => {
+    if (chartPending) flushChart();
+  });
+};
+// The counted status lives on the card: case keys can repeat across cards.
+const trackCaseStatus = (card, value) => {
+  const previous = card._countedStatus;
+  if (previous !== undefined) statusSummary[previous] = (statusSummary[previous] || 0) - 1;
+  statusSummary[value] = (statusSummary[value] || 0) + 1;
+  card._countedStatus = value;
+  return previous;
+};
+const logEvent = (action) => {
+  state.logs.push({ at: new Date().toISOString(), action });
+  saveState();
+  scheduleLogRender();
+};
+const envPlatform = document.getElementById('env-platform');
+const envOs = document.getElementById('env-os');
+const envVersion = document.getElementById('env-version');
+const envRevision = document.getElementById('env-revision');
+const bindMetaInput = (input, key, label) => {
+  if (!input) return;
+  if (state.meta.environment[key]) {
+    input.value = state.meta.environment[key];
+  } else if (input.value) {
+    state.meta.environment[key] = input.value;
+  }
+  input.addEventListener('input', () => {
+    state.meta.environment[key] = input.value;
+    saveState();
+  });
+  input.addEventListener('change', () => {
+    logEvent(`${label} set to ${input.value}`);
+  });
+};
+const collectorInput = document.getElementById('collector');
+if (collectorInput) {
+  if (state.meta.collector) collectorInput.value = state.meta.collector;
+  collectorInput.addEventListener('input', () => {
+    state.meta.collector = collectorInput.value;
+    saveState();
+  });
+  collectorInput.addEventListener('change', () => {
+    logEvent(`Collector set to ${collectorInput.value}`);
+  });
+}
+bindMetaInput(envPlatform, 'platform', 'Platform');
+bindMetaInput(envOs, 'os_version', 'OS version');
+bindMetaInput(envVersion, 'app_version', 'App version');
+bindMetaInput(envRevision, 'revision', 'Revision');
+const channelCheckboxes = document.querySelectorAll('.env-channel');
+const savedChannels = new Set(state.meta.environment.channels || []);
+channelCheckboxes.forEach((box) => {
+  if (savedChannels.has(box.value)) {
+    box.checked = true;
+  }
+});
+const mapChecked = (list, out = []) => {
+  for (let i = 0; i < list.length; i++) {
+    if (list[i].checked) out.push(list[i].value);
+  }
+  return out;
+};
+const getCheckedChannels = () => mapChecked(channelCheckboxes);
+const updateChannels = () => {
+  const selected = getCheckedChannels();
+  state.meta.environment.channels = selected;
+  saveState();
+  return selected;
+};
+channelCheckboxes.forEach((box) => {
+  box.addEventListener('change', () => {
+    const selected = updateChannels();
+    logEvent(`Channel selection: ${selected.join(', ')}`);
+  });
+});
+document.querySelectorAll('.env-row input').forEach((input) => {
+  input.addEventListener('focus', () => input.select());
+});
+const versionRaw = document.getElementById('version-raw');
+const RE_NEWLINE = /\r?\n/;
+const RE_WHITESPACE = /\s+/;
+const RE_BRAVE = /Brave\s+([^\s]+).*?(nightly|beta|stable)/i;
+const RE_BRAVE_CHROMIUM = /Chromium:\s*([^\s]+)/i;
+const RE_CHROMIUM = /Chromium\s+([^\s]+)/i;
+const RE_CHANNEL = /Channel\s*:\s*(.*)$/i;
+const RE_REVISION = /Revision\s+(.*)$/i;
+const RE_OS = /OS\s+(.*)$/i;
+const parseVersion = (raw) => {
+  const lines = raw.split(RE_NEWLINE).map((l) => l.trim()).filter(Boolean);
+  const braveLine = lines.find((l) => l.startsWith('Brave')) || '';
+  const chromiumLine = lines.find((l) => l.startsWith('Chromium')) || '';
+  const osLine = lines.find((l) => l.startsWith('OS')) || '';
+  const channelLine = lines.find((l) => l.toLowerCase().startsWith('channel')) || '';
+  let appVersion = '';
+  let chromiumVersion = '';
+  let revision = '';
+  let channel = '';
+  if (braveLine) {
+    const match = braveLine.match(RE_BRAVE);
+    if (match) {
+      appVersion = match[1] || '';
+      channel = match[2] || '';
+    } else {
+      const parts = braveLine.split(RE_WHITESPACE);
+      appVersion = parts[1] || '';
+    }
+    const chromiumMatch = braveLine.match(RE_BRAVE_CHROMIUM);
+    if (chromiumMatch) chromiumVersion = chromiumMatch[1] || '';
+  }
+  if (!chromiumVersion && chromiumLine) {
+    const match = chromiumLine.match(RE_CHROMIUM);
+    chromiumVersion = match ? match[1] : '';
+  }
+  if (!channel && channelLine) {
+    const match = channelLine.match(RE_CHANNEL);
+    channel = match ? match[1] : '';
+  }
+  const revisionLine = lines.find((l) => l.startsWith('Revision')) || '';
+  if (revisionLine) {
+    const match = revisionLine.match(RE_REVISION);
+    revision = match ? match[1] : '';
+  }
+  let osVersion = '';
+  if (osLine) {
+    const match = osLine.match(RE_OS);
+    osVersion = match ? match[1] : '';
+  }
+  return { appVersion, chromiumVersion, osVersion, channel, revision };
+};
+const normalizeChannelLabel = (value) => {
+  const normalized = (value || '').toLowerCase();
+  if (normalized.includes('nightly')) return 'nightly';
+  if (normalized.includes('beta')) return 'beta';
+  if (normalized.includes('stable') || normalized.includes('release')) return 'release (stable)';
+  return '';
+};
+const inferPlatform = (osValue) => {
+  const text = (osValue || '').toLowerCase();
+  if (text.includes('android')) return 'Android';
+  if (text.includes('ios') || text.includes('ipad') || text.includes('iphone')) return 'iOS';
+  if (text.includes('mac')) return 'Desktop';
+  if (text.includes('windows')) return 'Desktop';
+  if (text.includes('linux') || text.includes('ubuntu') || text.includes('debian')) return 'Desktop';
+  return '';
+};
+const applyParsed = (parsed) => {
+  const environment = state.meta.environment;
+  let changed = false;
+  if (parsed.appVersion) {
+    const chromium = parsed.chromiumVersion ? ` (Chromium ${parsed.chromiumVersion})` : '';
+    envVersion.value = `${parsed.appVersion}${chromium}`;
+    environment.app_version = envVersion.value;
+    changed = true;
+  }
+  if (parsed.osVersion) {
+    envOs.value = parsed.osVersion;
+    environment.os_version = envOs.value;
+    changed = true;
+  }
+  const inferredPlatform = inferPlatform(parsed.osVersion);
+  if (inferredPlatform) {
+    envPlatform.value = inferredPlatform;
+    environment.platform = envPlatform.value;
+    changed = true;
+  }
+  if (parsed.revision) {
+    envRevision.value = parsed.revision;
+    environment.revision = envRevision.value;
+    changed = true;
+  }
+  if (parsed.channel) {
+    const normalized = normalizeChannelLabel(parsed.channel);
+    channelCheckboxes.forEach((box) => {
+      const val = box.value.toLowerCase();
+      box.checked = normalized ? val.includes(normalized) : false;
+    });
+    environment.channels = getCheckedChannels();
+    changed = true;
+  }
+  if (changed) scheduleSave();
+};
+const versionCopyBtn = document.querySelector('[data-copy="version"]');
+const openVersionBtn = document.getElementById('open-version');
+const versionStatus = document.getElementById('version-status');
+const showVersionStatus = (text) => {
+  if (!versionStatus) return;
+  versionStatus.textContent = text;
+  versionStatus.classList.add('show');
+  setTimeout(() => {
+    versionStatus.textContent = '';
+    versionStatus.classList.remove('show');
+  }, 2500);
+};
+if (openVersionBtn) {
+  openVersionBtn.addEventListener('click', async () => {
+    const targetUrl = 'brave://version';
+    let copied = false;
+    try {
+      if (navigator.clipboard && navigator.clipboard.writeText) {
+        await navigator.clipboard.writeText(targetUrl);
+        copied = true;
+      }
+    } catch (err) {}
+    try {
+      window.location.href = targetUrl;
+      showVersionStatus(copied ? 'Opened brave://version. Link copied—paste if blocked.' : 'Opened brave://version. If blocked, paste the link in the address bar.');
+      return;
+    } catch (err) {}
+    try {
+      window.open(targetUrl, '_blank');
+      showVersionStatus(copied ? 'Opened brave://version. Link copied—paste if blocked.' : 'Opened brave://version. If blocked, paste the link in the address bar.');
+      return;
+    } catch (err) {}
+    showVersionStatus(copied ? 'Copied brave://version. Paste it in the address bar.' : 'Paste brave://version in the address bar.');
+  });
+}
+if (versionCopyBtn && versionRaw) {
+  versionCopyBtn.addEventListener('click', async () => {
+    try {
+      if (navigator.clipboard && navigator.clipboard.readText) {
+        versionRaw.value = await navigator.clipboard.readText();
+      }
+    } catch (err) {}
+    const parsed = parseVersion(versionRaw.value || '');
+    applyParsed(parsed);
+    copyText('Parsed', versionCopyBtn, versionCopyBtn.parentElement?.querySelector('.copy-status'));
+  });
+}
+if (versionRaw) {
+  const autoParse = () => {
+    const parsed = parseVersion(versionRaw.value || '');
+    applyParsed(parsed);
+  };
+  versionRaw.addEventListener('paste', () => setTimeout(autoParse, 50));
+  versionRaw.addEventListener('input', () => {
+    if (!versionRaw.value.trim()) return;
+    autoParse();
+  });
+}
+document.querySelectorAll('.env-clear').forEach((btn) => {
+  const input = document.getElementById(btn.getAttribute('data-target'));
+  if (!input) return;
+  btn.addEventListener('click', () => {
+    input.value = '';
+    input.dispatchEvent(new Event('input'));
+    input.focus();
+  });
+});
+const templateSelect = document.getElementById('env-template');
+if (templateSelect) {
+  const templates = JSON.parse(templateSelect.dataset.templates || '[]');
+  templateSelect.addEventListener('change', () => {
+    const selected = templates.find((t) => t.name === templateSelect.value);
+    if (!selected) return;
+    envPlatform.value = selected.platform || '';
+    envOs.value = selected.os_version || '';
+    envVersion.value = selected.app_version || '';
+    envRevision.value = selected.revision || selected.build || '';
+    state.meta.environment = {
+      platform: selected.platform || '',
+      os_version: selected.os_version || '',
+      app_version: selected.app_version || '',
+      build: selected.build || '',
+    };
+    saveState();
+    logEvent(`Template applied: ${selected.name}`);
+  });
+}
+const setStatusClass = (card, value) => {
+  const next = value || 'not_set';
+  if (card.dataset.status === next) return;
+  card.dataset.status = next;
+  card.classList.remove('status-pass', 'status-fail', 'status-blocked', 'status-skipped');
+  if (next !== 'not_set') {
+    card.classList.add(`status-${next}`);
+  }
+  const indicator = card._refs.indicator;
+  if (indicator) {
+    indicator.setAttribute('data-status', next);
+  }
+};
+// Screenshots of other runs are kept this long after they were added, so
+// reports reopened within a month get their proof images back.
+const SCREENSHOT_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+const screenshotStore = (() => {
+  let dbPromise = null;
+  const openDb = () => {
+    if (!dbPromise) {
+      dbPromise = new Promise((resolve, reject) => {
+        if (!window.indexedDB) {
+          reject(new Error('IndexedDB is not available'));
+          return;
+        }
+        const request = indexedDB.open('customChecklist', 1);
+        request.onupgradeneeded = () => {
+          const store = request.result.createObjectStore('screenshots', { keyPath: 'id', autoIncrement: true });
+          store.createIndex('scope', 'scope');
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+      });
+    }
+    return dbPromise;
+  };
+  const run = (mode, action) => openDb().then((db) => new Promise((resolve, reject) => {
+    const tx = db.transaction('screenshots', mode);
+    const request = action(tx.objectStore('screenshots'));
+    tx.oncomplete = () => resolve(request.result);
+    tx.onerror = () => reject(tx.error);
+  }));
+  return {
+    add: (caseKey, caseIndex, name, blob) => run('readwrite', (store) => store.add({ scope: storageKey, caseKey, caseIndex, name, blob, savedAt: Date.now() })),
+    remove: (id) => run('readwrite', (store) => store.delete(id)),
+    list: () => run('readonly', (store) => store.index('scope').getAll(storageKey)),
+    // Drops other runs' screenshots older than maxAge; records without
+    // savedAt predate the field and count as expired.
+    prune: (maxAge) => run('readwrite', (store) => {
+      const cutoff = Date.now() - maxAge;
+      const request = store.openCursor();
+      request.onsuccess = () => {
+        const cursor = request.result;
+        if (!cursor) return;
+        const record = cursor.value;
+        if (record.scope !== storageKey && !(record.savedAt > cutoff)) cursor.delete();
+        cursor.continue();
+      };
+      return request;
+    }),
+  };
+})();
+const readAsDataUrl = (blob) => new Promise((resolve, reject) => {
+  const reader = new FileReader();
+  reader.onload = () => resolve(reader.result);
+  reader.onerror = () => reject(reader.error);
+  reader.readAsDataURL(blob);
+});
+const addProofImage = (card, name, dataUrl) => {
+  const wrapper = document.createElement('div');
+  wrapper.className = 'case-proof-item';
+  const img = document.createElement('img');
+  img.src = dataUrl;
+  img.dataset.name = name;
+  const removeBtn = document.createElement('button');
+  removeBtn.type = 'button';
+  removeBtn.className = 'case-proof-remove';
+  removeBtn.title = 'Remove screenshot';
+  removeBtn.textContent = '×';
+  wrapper.appendChild(img);
+  wrapper.appendChild(removeBtn);
+  card._refs.proof.appendChild(wrapper);
+  card._imageSrcs.push(dataUrl);
+  reportCache = null;
+  return img;
+};
+const collectSteps = (card) => {
+  if (card._stepsText === undefined) {
+    const lines = [];
+    const list = card._refs.steps;
+    for (let li = list && list.firstElementChild; li; li = li.nextElementSibling) {
+      lines.push(`${lines.length + 1}. ${li.textContent.trim()}`);
+    }
+    card._stepsText = lines.join('\n');
+  }
+  return card._stepsText;
+};
+const collectNotes = (card) => {
+  const notes = card._refs.notes;
+  return notes ? notes.value.trim() : '';
+};
+const collectActual = (card) => {
+  const actual = card._refs.actual;
+  return actual ? actual.value.trim() : '';
+};
+const collectBugLink = (card) => {
+  const bugInput = card._refs.bug;
+  return bugInput ? bugInput.value.trim() : '';
+};
+const collectAttachments = (card) => {
+  const images = card._refs.proof.getElementsByTagName('img');
+  const lines = [];
+  for (let i = 0; i < images.length; i++) {
+    lines.push(`- ${images[i].dataset.name || `screenshot-${i + 1}`}`);
+  }
+  return lines.join('\n');
+};
+const collectSummary = (card) => {
+  const title = card.getAttribute('data-case-title') || card.getAttribute('data-case-key');
+  const status = card._refs.status;
+  const statusValue = status ? status.value : 'not_set';
+  const parts = [
+    `Title: ${title}`,
+    `Status: ${statusValue}`,
+  ];
+  const bugLink = collectBugLink(card);
+  if (bugLink) parts.push(`Bug: ${bugLink}`);
+  const steps = collectSteps(card);
+  if (steps) parts.push('Steps:\n' + steps);
+  const notesText = collectNotes(card);
+  if (notesText) parts.push('Notes:\n' + notesText);
+  const actualText = collectActual(card);
+  if (actualText) parts.push('Actual result:\n' + actualText);
+  const attachments = collectAttachments(card);
+  if (attachments) parts.push('Attachments:\n' + attachments);
+  return parts.join('\n\n');
+};
+const caseCopyCollectors = {
+  steps: collectSteps,
+  notes: collectNotes,
+  attachments: collectAttachments,
+  actual: collectActual,
+  summary: collectSummary,
+  bug: collectBugLink,
+};
+const caseCardList = document.querySelectorAll('.case');
+caseCardList.forEach((card, index) => {
+  const key = card.getAttribute('data-case-key');
+  card._caseIndex = index;
+  card._imageSrcs = [];
+  // Looked up once here; the collectors, report and export read these
+  // instead of querying the card again.
+  const refs = {
+    check: card.querySelector('.case-check'),
+    status: card.querySelector('.case-status'),
+    indicator: card.querySelector('.status-indicator'),
+    notes: card.querySelector('.case-notes'),
+    actual: card.querySelector('.case-actual'),
+    bug: card.querySelector('.bug-link-input'),
+    steps: card.querySelector('ol'),
+    proof: card.querySelector('.case-proof'),
+  };
+  card._refs = refs;
+  const { check: checkbox, notes, actual, status, bug: bugInput } = refs;
+  const saved = state[key] || {};
+  checkbox.checked = !!saved.checked;
+  notes.value = saved.notes || '';
+  if (actual) actual.value = saved.actual_result || '';
+  status.value = saved.status || 'not_set';
+  setStatusClass(card, status.value);
+  trackCaseStatus(card, status.value);
+  if (bugInput) {
+    bugInput.value = saved.bug_link || '';
+  }
+});
+// Case keys can repeat, so records point at their card by position; the key
+// check (and the key-only fallback for older records) guards against a
+// record that doesn't fit this page.
+const findRecordCard = (record) => {
+  const card = caseCardList[record.caseIndex];
+  if (card && card.getAttribute('data-case-key') === record.caseKey) return card;
+  return Array.prototype.find.call(caseCardList, (c) => c.getAttribute('data-case-key') === record.caseKey);
+};
+screenshotStore.list().then((records) => {
+  const pending = [];
+  records.forEach((record) => {
+    const card = findRecordCard(record);
+    if (card && !card._refs.proof.querySelector(`img[data-shot-id="${record.id}"]`)) {
+      pending.push({ record, card });
+    }
+  });
+  // One unreadable blob only skips its own screenshot.
+  const reads = pending.map(({ record }) => readAsDataUrl(record.blob).catch(() => null));
+  return Promise.all(reads).then((dataUrls) => {
+    pending.forEach(({ record, card }, idx) => {
+      if (dataUrls[idx] === null) return;
+      const img = addProofImage(card, record.name, dataUrls[idx]);
+      img.dataset.shotId = record.id;
+      img._shotSaved = Promise.resolve(record.id);
+    });
+  });
+}).catch(() => {}).then(() => screenshotStore.prune(SCREENSHOT_MAX_AGE_MS)).catch(() => {});
+document.addEventListener('input', (event) => {
+  const target = event.target;
+  const card = target.closest('.case');
+  if (!card) return;
+  const key = card.getAttribute('data-case-key');
+  if (target.matches('.bug-link-input')) {
+    state[key] = state[key] || {};
+    state[key].bug_link = target.value.trim();
+    scheduleSave();
+  } else if (target.matches('.case-notes')) {
+    state[key] = state[key] || {};
+    state[key].notes = target.value;
+    scheduleSave();
+  } else if (target.matches('.case-actual')) {
+    state[key] = state[key] || {};
+    state[key].actual_result = target.value;
+    scheduleSave();
+  }
+});
+document.addEventListener('change', (event) => {
+  const target = event.target;
+  const card = target.closest('.case');
+  if (!card) return;
+  const key = card.getAttribute('data-case-key');
+  if (target.matches('.case-check')) {
+    state[key] = state[key] || {};
+    state[key].checked = target.checked;
+    scheduleSave();
+    logEvent(`Case ${key} checkbox set to ${target.checked}`);
+  } else if (target.matches('.case-status')) {
+    state[key] = state[key] || {};
+    state[key].status = target.value;
+    saveState();
+    logEvent(`Case ${key} status set to ${target.value}`);
+    setStatusClass(card, target.value);
+    const previous = trackCaseStatus(card, target.value);
+    scheduleChart(previous, target.value);
+  } else if (target.matches('.bug-link-input')) {
+    if (target.value) {
+      logEvent(`Case ${key} bug link set to ${target.value}`);
+    }
+  } else if (target.matches('.case-notes')) {
+    logEvent(`Case ${key} notes updated`);
+  } else if (target.matches('.case-actual')) {
+    logEvent(`Case ${key} actual result updated`);
+  } else if (target.matches('.case-file')) {
+    const files = Array.from(target.files || []);
+    if (!files.length) return;
+    files.forEach((file) => {
+      readAsDataUrl(file).then((dataUrl) => {
+        const img = addProofImage(card, file.name, dataUrl);
+        saveState();
+        logEvent(`Case ${key} added screenshot ${file.name}`);
+        // Kept on the img so a removal made before the add settles can still
+        // delete the record once its id is known.
+        img._shotSaved = screenshotStore.add(key, card._caseIndex, file.name, file).then((id) => {
+          img.dataset.shotId = id;
+          return id;
+        });
+        img._shotSaved.catch(() => {});
+      });
+    });
+    target.value = '';
+  }
+});
+document.addEventListener('click', (event) => {
+  const button = event.target.closest('button');
+  if (!button) return;
+  const card = button.closest('.case');
+  if (!card) return;
+  const key = card.getAttribute('data-case-key');
+  if (button.matches('.case-proof-remove')) {
+    const wrapper = button.closest('.case-proof-item');
+    const img = wrapper.querySelector('img');
+    const index = Array.prototype.indexOf.call(wrapper.parentNode.children, wrapper);
+    if (index >= 0) card._imageSrcs.splice(index, 1);
+    wrapper.remove();
+    if (img && img._shotSaved) {
+      img._shotSaved.then((id) => screenshotStore.remove(id)).catch(() => {});
+    }
+    saveState();
+    logEvent(`Case ${key} removed screenshot ${img ? img.dataset.name : ''}`);
+    return;
+  }
+  if (button.matches('[data-action="open-issue"]')) {
+    getIssueHelper().open(card);
+    return;
+  }
+  const collect = button.matches('.copy-btn') ? caseCopyCollectors[button.getAttribute('data-copy')] : null;
+  if (collect) copyText(collect(card), button);
+});
+const envCopyBtn = document.querySelector('.env-copy .copy-btn');
+if (envCopyBtn) {
+  const envStatus = document.querySelector('.env-copy .copy-status');
+  envCopyBtn.addEventListener('click', () => {
+    const channels = getCheckedChannels().join(', ');
+    const envText = [
+      `Platform: ${envPlatform.value || ''}`,
+      `OS version: ${envOs.value || ''}`,
+      `App version: ${envVersion.value || ''}`,
+      `Revision: ${envRevision.value || ''}`,
+      `Channel: ${channels}`
+    ].join('\n');
+    copyText(envText, envCopyBtn, envStatus);
+  });
+}
+renderLogs();
+renderStatusChart();
+const buildEnvironment = () => ({
+  platform: envPlatform.value || '',
+  os_version: envOs.value || '',
+  app_version: envVersion.value || '',
+  revision: envRevision.value || '',
+  channels: getCheckedChannels(),
+});
+const buildReport = () => {
+  const cases = [];
+  document.querySelectorAll('.case').forEach((card) => {
+    const key = card.getAttribute('data-case-key');
+    const title = card.getAttribute('data-case-title');
+    const { check: checkbox, notes, actual, status, bug: bugInput } = card._refs;
+    const images = card._imageSrcs.slice();
+    const bugLink = bugInput ? bugInput.value.trim() : '';
+    cases.push({
+      key,
+      title,
+      checked: checkbox.checked,
+      status: status.value,
+      notes: notes.value,
+      actual_result: actual ? actual.value : '',
+      bug_link: bugLink,
+      images,
+    });
+  });
+  return {
+    title: document.title,
+    generatedAt: new Date().toISOString(),
+    collector: state.meta.collector || collectorInput.value || '',
+    environment: buildEnvironment(),
+    logs: state.logs || [],
+    cases,
+  };
+};
+const cachedBuildReport = () => {
+  if (!reportCache) reportCache = buildReport();
+  reportCache.generatedAt = new Date().toISOString();
+  return reportCache;
+};
+class IssueHelper {
+  constructor() {
+    this.modal = document.getElementById('issue-modal');
+    this.repoInput = document.getElementById('issue-repo');
+    this.titleInput = document.getElementById('issue-title');
+    this.templateSelect = document.getElementById('issue-template');
+    this.bodyInput = document.getElementById('issue-body');
+    this.openBtn = document.getElementById('issue-open');
+    this.closeBtn = document.getElementById('issue-close');
+    this.currentCard = null;
+    this.bind();
+  }
+  bind() {
+    if (this.closeBtn) this.closeBtn.addEventListener('click', () => this.close());
+    if (this.openBtn) this.openBtn.addEventListener('click', () => this.openGitHub());
+  }
+  open(card) {
+    this.currentCard = card;
+    const issue = this.buildIssue(card);
+    this.titleInput.value = issue.title;
+    this.bodyInput.value = issue.body;
+    this.modal.classList.add('open');
+  }
+  close() {
+    this.modal.classList.remove('open');
+  }
+  openGitHub() {
+    const repo = (this.repoInput.value || '').trim().replace(/\/+$/, '');
+    if (!repo) return;
+    const title = this.titleInput.value || 'Bug report';
+    const body = this.bodyInput.value || '';
+    const template = this.templateSelect ? this.templateSelect.value : '';
+    const fields = this.buildTemplateFields(template, this.currentCard);
+    const params = new URLSearchParams();
+    params.set('title', title);
+    if (body) params.set('body', body);
+    if (template) params.set('template', template);
+    Object.entries(fields).forEach(([key, value]) => {
+      if (!value) return;
+      if (Array.isArray(value)) {
+        value.forEach((entry) => {
+          if (!entry) return;
+          params.append(`${key}[]`, entry);
+          params.append(key, entry);
+        });
+        return;
+      }
+      params.append(key, value);
+    });
+    const url = `${repo}/issues/new?${params.toString()}`;
+    window.open(url, '_blank');
+  }
+  buildTemplateFields(template, card) {
+    if (!card) return {};
+    const title = card.getAttribute('data-case-title') || 'Bug report';
+    const refs = card._refs;
+    const status = refs.status?.value || 'not_set';
+    const steps = collectSteps(card);
+    const notes = refs.notes?.value || '';
+    const actual = refs.actual?.value || '';
+    const bugLink = refs.bug?.value || '';
+    const attachments = collectAttachments(card);
+    let expected = '';
+    const metas = card.getElementsByClassName('meta');
+    for (let i = 0; i < metas.length; i++) {
+      const text = metas[i].textContent;
+      if (text.trim().startsWith('Expected:')) {
+        expected = text.replace(/^Expected:\s*/i, '');
+        break;
+      }
+    }
+    const env = buildEnvironment();
+    const qa = (collectorInput?.value || '').trim();
+    const channels = env.channels || [];
+    const envParts = [];
+    if (env.platform) envParts.push(`Platform: ${env.platform}`);
+    if (env.os_version) envParts.push(`OS version: ${env.os_version}`);
+    if (env.app_version) envParts.push(`App version: ${env.app_version}`);
+    if (env.revision) envParts.push(`Revision: ${env.revision}`);
+    if (channels.length) envParts.push(`Channel: ${channels.join(', ')}`);
+    const descriptionParts = [`Case: ${title}`, `Status: ${status}`];
+    if (qa) descriptionParts.push(`QA: ${qa}`);
+    if (notes) descriptionParts.push(`Notes: ${notes}`);
+    const description = descriptionParts.join('\n');
+    let actualWithAttachments = actual;
+    if (attachments) actualWithAttachments += `\n\nAttachments (upload files manually):\n${attachments}`;
+    const miscParts = [];
+    if (bugLink) miscParts.push(`Bug: ${bugLink}`);
+    if (attachments) miscParts.push(`Attachments:\n${attachments}`);
+    const baseFields = {
+      description,
+      str: steps,
+      result: actualWithAttachments,
+      expectation: expected,
+      version: envParts.join('\n'),
+      channels,
+      reproducibility: '',
+      misc: miscParts.join('\n\n')
+    };
+    const templateName = (template || '').toLowerCase();
+    if (templateName.includes('feature')) {
+      return {
+        platforms: env.platform || '',
+        description: description || notes || ''
+      };
+    }
+    if (templateName.includes('chromium_bump')) {
+      return {
+        bump: '',
+        qa: '',
+        checks: ''
+      };
+    }
+    if (templateName.includes('code_health')) {
+      return { description: description || notes || '' };
+    }
+    if (templateName.includes('ios')) {
+      return {
+        ...baseFields,
+        device: [env.platform, env.os_version].filter(Boolean).join(' '),
+        affected: ''
+      };
+    }
+    if (templateName.includes('android')) {
+      return {
+        ...baseFields,
+        device: [env.platform, env.os_version].filter(Boolean).join(' ')
+      };
+    }
+    return baseFields;
+  }
+  buildIssue(card) {
+    const title = card.getAttribute('data-case-title') || 'Bug report';
+    const refs = card._refs;
+    const status = refs.status?.value || 'not_set';
+    const steps = collectSteps(card);
+    const notes = refs.notes?.value || '';
+    const actual = refs.actual?.value || '';
+    const attachments = collectAttachments(card);
+    const env = buildEnvironment();
+    const qa = (collectorInput?.value || '').trim();
+    const parts = [
+      '### Summary',
+      `- Case: ${title}`,
+      `- Status: ${status}`,
+    ];
+    if (qa) parts.push(`- QA: ${qa}`);
+    parts.push(
+      '### Environment',
+      `- Platform: ${env.platform}`,
+      `- OS version: ${env.os_version}`,
+      `- App version: ${env.app_version}`,
+      `- Revision: ${env.revision}`,
+      `- Channel: ${env.channels.join(', ')}`,
+    );
+    if (steps) parts.push(`### Steps\n${steps}`);
+    if (notes) parts.push(`### Notes\n${notes}`);
+    if (actual) parts.push(`### Actual result\n${actual}`);
+    if (attachments) parts.push(`### Attachments\n${attachments}\n\n(Images are attached in the HTML report.)`);
+    const body = parts.join('\n');
+    const prefix = this.titleInput?.value?.split(':')[0] || 'Bug';
+    return { title: `${prefix}: ${title}`, body };
+  }
+}
+let issueHelper = null;
+const getIssueHelper = () => {
+  if (!issueHelper) issueHelper = new IssueHelper();
+  return issueHelper;
+};
+const downloadFile = (filename, content, type) => {
+  const blob = new Blob(Array.isArray(content) ? content : [content], { type });
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = filename;
+  document.body.appendChild(link);
+  link.click();
+  setTimeout(() => URL.revokeObjectURL(url), 1000);
+  link.remove();
+};
+// Minimal copy handler for final reports, which drop the page script.
+const COPY_HANDLER_SRC = `
+  document.querySelectorAll('.copy-btn').forEach((btn) => {
+    btn.addEventListener('click', () => {
+      const text = btn.getAttribute('data-copy-text') || '';
+      if (!text) return;
+      const status = btn.closest('.block-head')?.querySelector('.copy-status') || btn.parentElement?.querySelector('.copy-status');
+      if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(text);
+      } else {
+        const area = document.createElement('textarea');
+        area.value = text;
+        document.body.appendChild(area);
+        area.select();
+        document.execCommand('copy');
+        area.remove();
+      }
+      btn.classList.add('copied');
+      if (status) {
+        status.textContent = 'Copied';
+        status.classList.add('show');
+        setTimeout(() => {
+          status.textContent = '';
+          status.classList.remove('show');
+        }, 1500);
+      }
+      setTimeout(() => btn.classList.remove('copied'), 1500);
+    });
+  });
+`;
+const exportHtml = (filename, isFinal) => {
+  const checkedChannels = getCheckedChannels();
+  const originalChannels = new Set(checkedChannels);
+  const envText = [
+    `Platform: ${envPlatform.value || ''}`,
+    `OS version: ${envOs.value || ''}`,
+    `App version: ${envVersion.value || ''}`,
+    `Revision: ${envRevision.value || ''}`,
+    `Channel: ${checkedChannels.join(', ')}`
+  ].join('\n');
+  if (logRenderScheduled) renderLogs();
+  if (chartPending) flushChart();
+  const clone = document.documentElement.cloneNode(true);
+  const liveCards = document.querySelectorAll('.case');
+  const cloneCards = clone.querySelectorAll('.case');
+  for (let c = 0; c < liveCards.length; c++) {
+    const card = liveCards[c];
+    const target = cloneCards[c];
+    const { check, status } = card._refs;
+    const targetCheck = target.getElementsByClassName('case-check')[0];
+    if (targetCheck && check) targetCheck.checked = check.checked;
+    const targetStatus = target.getElementsByClassName('case-status')[0];
+    if (targetStatus && status) targetStatus.value = status.value;
+    const buttons = target.getElementsByClassName('copy-btn');
+    for (let i = 0; i < buttons.length; i++) {
+      const collect = caseCopyCollectors[buttons[i].getAttribute('data-copy')];
+      if (collect) buttons[i].setAttribute('data-copy-text', collect(card));
+    }
+  }
+  clone.querySelectorAll('input, select, textarea').forEach((field) => {
+    if (field.tagName === 'TEXTAREA') {
+      field.textContent = field.value;
+      if (isFinal) field.readOnly = true;
+      return;
+    }
+    if (field.tagName === 'SELECT') {
+      let selectedValue = field.value;
+      if (field.id === 'collector' && collectorInput) {
+        selectedValue = collectorInput.value;
+      }
+      const options = field.options;
+      for (let i = 0; i < options.length; i++) {
+        options[i].defaultSelected = options[i].value === selectedValue;
+      }
+      if (isFinal) field.disabled = true;
+      return;
+    }
+    if (field.type === 'file' && isFinal) {
+      field.remove();
+      return;
+    }
+    if (field.type === 'checkbox') {
+      let checked = field.checked;
+      if (field.classList.contains('env-channel')) {
+        checked = originalChannels.has(field.value);
+      }
+      field.defaultChecked = checked;
+      if (isFinal) field.disabled = true;
+      return;
+    }
+    field.setAttribute('value', field.value);
+    if (isFinal) field.readOnly = true;
+  });
+  clone.querySelectorAll('button').forEach((btn) => {
+    if (!btn.classList.contains('copy-btn')) {
+      if (isFinal) btn.remove();
+      return;
+    }
+    if (btn.closest('.env-copy')) {
+      btn.setAttribute('data-copy-text', envText);
+    }
+  });
+  const report = cachedBuildReport();
+  // Indented for the visible <pre>; compact for the machine-read script block.
+  const reportPre = clone.querySelector('#qa-report-data');
+  if (reportPre) reportPre.textContent = JSON.stringify(report, null, 2);
+  const reportScript = clone.querySelector('#qa-report-json');
+  if (reportScript) reportScript.textContent = JSON.stringify(report);
+  if (isFinal) {
+    clone.querySelectorAll('script').forEach((script) => script.remove());
+    const copyScript = clone.ownerDocument.createElement('script');
+    copyScript.textContent = COPY_HANDLER_SRC;
+    const cloneBody = clone.querySelector('body');
+    if (cloneBody) cloneBody.appendChild(copyScript);
+  }
+  // Kept as parts so the Blob or writable takes them as-is, instead of
+  // copying the whole (screenshot-heavy) document into one more string.
+  const htmlParts = ['<!doctype html>\n', clone.outerHTML];
+  if (!isFinal) {
+    downloadFile(filename, htmlParts, 'text/html');
+  }
+  return htmlParts;
+};
+document.getElementById('export-json').addEventListener('click', () => {
+  const report = cachedBuildReport();
+  const filename = `${reportSlug()}-report.json`;
+  downloadFile(filename, JSON.stringify(report, null, 2), 'application/json');
+});
+document.getElementById('export-log').addEventListener('click', () => {
+  const report = cachedBuildReport();
+  const filename = `${reportSlug()}-activity-log.json`;
+  downloadFile(filename, JSON.stringify(report.logs || [], null, 2), 'application/json');
+});
+document.getElementById('save-final').addEventListener('click', async () => {
+  const filename = `${baseFileName}-final.html`;
+  const htmlParts = exportHtml(filename, true);
+  if (window.showSaveFilePicker) {
+    try {
+      const handle = await window.showSaveFilePicker({
+        suggestedName: filename,
+        types: [{ description: 'HTML File', accept: { 'text/html': ['.html'] } }],
+      });
+      const writable = await handle.createWritable();
+      for (const part of htmlParts) await writable.write(part);
+      await writable.close();
+      return;
+    } catch (err) {
+      // fall back to download
+    }
+  }
+  downloadFile(filename, htmlParts, 'text/html');
+});